@@ -22,27 +22,33 @@ from dev.utils.functs import interaction_response
 
 __all__ = ("SettingsToggler",)
 
+#  Options are fixed once Settings is created, so this only has to be computed once
+_BOOLEAN_OPTIONS = frozenset(option.name for option in Settings.__options__.values() if option._type is bool)
+#  The same goes for the labels of each option's button
+_OPTION_LABELS = {
+    setting: " ".join(word.lower() if len(word) <= 2 else word.title() for word in setting.split("_"))
+    for setting in Settings.__options__
+}
+
 
 class SettingsToggler(discord.ui.Button[AuthoredMixin]):
     def __init__(self, setting: str, author: Optional[int], *, label: str) -> None:
         super().__init__(label=label)
         self.author: Optional[int] = author
         self.setting: str = setting.upper().replace(" ", "_")
-        self._boolean_options = [option.name for option in Settings.__options__.values() if option._type is bool]
-        if self.setting in self._boolean_options:
+        if self.setting in _BOOLEAN_OPTIONS:
             self.style = discord.ButtonStyle.green if getattr(Settings, setting) else discord.ButtonStyle.red
         else:
             self.style = discord.ButtonStyle.blurple
 
     @classmethod
     def from_view(cls, view: AuthoredMixin, /) -> AuthoredMixin:
-        for setting in Settings.__options__:
-            fmt = " ".join(word.lower() if len(word) <= 2 else word.title() for word in setting.split("_"))
-            view.add_item(cls(setting, view.author, label=fmt))
+        for setting, label in _OPTION_LABELS.items():
+            view.add_item(cls(setting, view.author, label=label))
         return view
 
     async def callback(self, interaction: discord.Interaction) -> None:
-        if self.setting not in self._boolean_options:
+        if self.setting not in _BOOLEAN_OPTIONS:
             label = self.label
             if label is not None:
                 return await interaction.response.send_modal(SettingsEditor(self.setting))
@@ -59,6 +65,7 @@ class SettingsToggler(discord.ui.Button[AuthoredMixin]):
         else:
             setattr(Settings, setting, True)
             self.style = discord.ButtonStyle.green
-        view = AuthoredMixin(self.author)
-        self.from_view(view)
-        await interaction_response(interaction, discord.InteractionResponseType.message_update, view)
+        #  Only this option changed, so there is no need to build a new view and
+        #  look up every other option again just to re-render the same buttons.
+        assert self.view is not None
+        await interaction_response(interaction, discord.InteractionResponseType.message_update, self.view)
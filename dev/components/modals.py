@@ -55,7 +55,9 @@ class SettingsEditor(discord.ui.Modal):
 
     async def on_submit(self, interaction: discord.Interaction, /) -> None:
         try:
-            if isinstance(self.setting_obj, set):
+            #  Options that have a converter (such as sets) parse the raw text themselves,
+            #  so converting it beforehand would only make them parse it a second time.
+            if isinstance(self.setting_obj, set) and Settings.__options__[self.setting].converter is None:
                 setattr(Settings, self.setting, set(str_ints(self.item.value)))
             #  bool instances are toggleable buttons
             else:
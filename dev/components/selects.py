@@ -11,6 +11,7 @@ All :class:`discord.ui.Select` related classes.
 """
 from __future__ import annotations
 
+import copy
 import itertools
 from typing import TYPE_CHECKING, ClassVar, Dict, List, Optional
 
@@ -39,7 +40,9 @@ class PermissionsSelector(discord.ui.Select[AuthoredMixin]):
     ]
 
     def __init__(self, *, target: discord.Member, channel: Optional[types.Channel] = None) -> None:
-        super().__init__(options=list(self.OPTIONS))
+        #  The callback toggles which option is the default, so every selector needs its own copies.
+        #  Otherwise the choice would leak into the class-level options and every selector after it.
+        super().__init__(options=[copy.copy(option) for option in self.OPTIONS])
         self.target: discord.Member = target
         self.channel: Optional[types.Channel] = channel
 
@@ -57,17 +60,17 @@ class PermissionsSelector(discord.ui.Select[AuthoredMixin]):
 
     def sort_perms(self, permission: str) -> List[str]:
         perms = getattr(discord.Permissions, permission)()
-        perms_list: List[str] = []
-        for perm, value in perms:
-            if not value:
-                continue
-            if self.channel is not None:
-                toggled = dict(self.channel.permissions_for(self.target)).get(perm)
-            else:
-                toggled = dict(self.target.guild_permissions).get(perm)
-            perm_name = perm.replace("_", " ").title()
-            perms_list.append(f"\x1b[1;37m{perm_name:26}\x1b[0;{'32' if toggled else '31'}m{toggled}")
-        return perms_list
+        #  Resolving channel permissions means going through every overwrite,
+        #  so only do it once instead of for every permission that gets listed.
+        if self.channel is not None:
+            resolved = dict(self.channel.permissions_for(self.target))
+        else:
+            resolved = dict(self.target.guild_permissions)
+        return [
+            f"\x1b[1;37m{perm.replace('_', ' ').title():26}\x1b[0;{'32' if resolved[perm] else '31'}m{resolved[perm]}"
+            for perm, value in perms
+            if value
+        ]
 
 
 class SearchCategory(discord.ui.Select[AuthoredMixin]):
@@ -78,14 +81,16 @@ class SearchCategory(discord.ui.Select[AuthoredMixin]):
     def __init__(self, embed: discord.Embed, /, **categories: List[str]):
         categories = dict(sorted([(k, v) for k, v in categories.items() if v], key=lambda x: x[0]))
         options: List[discord.SelectOption] = [
-            option for option in self.OPTIONS if option.value in categories or option.value == "all"
+            copy.copy(option) for option in self.OPTIONS if option.value in categories or option.value == "all"
         ]
         super().__init__(options=options)
         self.embed: discord.Embed = embed
-        self._mapping: Dict[str, str] = {
-            "all": "\n".join(list(itertools.chain(*[v[:3] for v in categories.values()]))[:10]),
-            **{k: "\n".join(v) for k, v in categories.items() if v},
-        }
+        #  Empty categories were already filtered out above. The overview takes the first three
+        #  results of each category and stops as soon as it has ten of them.
+        self._mapping: Dict[str, str] = {k: "\n".join(v) for k, v in categories.items()}
+        self._mapping["all"] = "\n".join(
+            itertools.islice(itertools.chain.from_iterable(v[:3] for v in categories.values()), 10)
+        )
 
     async def callback(self, interaction: discord.Interaction) -> None:
         selected = discord.utils.get(self.options, default=True)
@@ -11,9 +11,8 @@ Custom converters used within the dev extension.
 """
 from __future__ import annotations
 
-import collections
 import re
-from typing import TYPE_CHECKING, Deque, List, Optional, TypeVar
+from typing import TYPE_CHECKING, List, Optional, TypeVar
 
 import discord
 from discord.ext import commands
@@ -27,6 +26,8 @@ __all__ = ("GlobalTextChannelConverter", "MessageCodeblock", "codeblock_converte
 
 T = TypeVar("T")
 
+_INTEGERS = re.compile(r"\d+")
+
 
 class GlobalTextChannelConverter(commands.TextChannelConverter):
     async def convert(self, ctx: commands.Context[types.Bot], argument: str) -> discord.TextChannel:
@@ -58,6 +59,8 @@ class MessageCodeblock:
         The highlight language of the codeblock, if any.
     """
 
+    __slots__ = ("content", "codeblock", "lang")
+
     def __init__(self, content: str, codeblock: Optional[str], highlightjs: Optional[str]) -> None:
         self.content: str = content
         self.codeblock: Optional[str] = clean_code(codeblock) if codeblock is not None else None
@@ -85,21 +88,18 @@ def codeblock_converter(content: str) -> MessageCodeblock:
     """
     start: Optional[int] = None
     lang: Optional[int] = None
-    last_seen: Deque[str] = collections.deque(maxlen=3)
-
-    for idx, char in enumerate(content):
-        last_seen.append(char)
-        if start is None and "".join(last_seen) == "```":
-            #  With this we know where the codeblock starts.
-            #  Likewise, we know where the argument will end.
-            start = idx - 2
-        if start is not None and char == "\n":
-            #  Now that we know we're actually in the codeblock,
-            #  we can find out which language was being used.
-            #  This also means that we can break out, because
-            #  everything else is of no use to us.
-            lang = idx
-            break
+
+    #  Searching for the delimiters directly is much faster than walking through every character
+    fence = content.find("```")
+    if fence != -1:
+        #  With this we know where the codeblock starts.
+        #  Likewise, we know where the argument will end.
+        start = fence
+        #  The first new line after the backticks tells us which language was being used.
+        #  Everything else is of no use to us.
+        newline = content.find("\n", fence + 3)
+        if newline != -1:
+            lang = newline
     hljs: Optional[str] = None
     codeblock: Optional[str] = None
     if start is not None and lang is not None:
@@ -126,17 +126,7 @@ def str_ints(content: str) -> List[int]:
     List[int]
         A list of the integers found in the string.
     """
-    int_list: List[int] = []
-    ints: str = ""
-    for char in content:
-        if char.isnumeric():
-            ints += char
-        if not char.isnumeric() and ints:
-            int_list.append(int(ints))
-            ints = ""
-    if ints.isnumeric():  # clear any extra integers
-        int_list.append(int(ints))
-    return int_list
+    return [int(match) for match in _INTEGERS.findall(content)]
 
 
 def str_bool(
@@ -69,10 +69,17 @@ class RelativeStandard(io.StringIO):
         self.filename: Optional[str] = filename
 
     def write(self, __s: str) -> int:
-        stack: Optional[inspect.FrameInfo] = discord.utils.get(inspect.stack(), filename=self.filename)
-        if stack:
+        #  inspect.stack() resolves the file and reads the surrounding source lines of every
+        #  frame on the stack, which is a lot of work just to compare filenames on every write.
+        frame = inspect.currentframe()
+        while frame is not None and frame.f_code.co_filename != self.filename:
+            frame = frame.f_back
+        if frame is not None:
+            #  Output that is handed to a callback is already kept by whoever receives it,
+            #  so it is only buffered when there is no callback to receive it.
             if self.callback is not None:
                 self.callback(__s)
+                return len(__s)
             return super().write(__s)
         self.origin.write(__s)
         return 0
@@ -81,6 +88,8 @@ class RelativeStandard(io.StringIO):
 class TimedInfo:
     """Helper class that deals with timing processes."""
 
+    __slots__ = ("timeout", "start", "end")
+
     def __init__(self, *, timeout: Optional[float] = None) -> None:
         self.timeout: Optional[float] = timeout
         self.start: Optional[float] = None
@@ -264,6 +273,10 @@ def replace_vars(string: str, scope: Scope) -> str:
     :class:`str`
         The converted string with the values of the virtual variables.
     """
-    for key, value in scope.items():
-        string = string.replace(Settings.VIRTUAL_VARS % key, value)
+    #  Settings are read back from the environment every time they're accessed,
+    #  so only look the format up once rather than for every variable.
+    virtual_vars = Settings.VIRTUAL_VARS
+    for variables in (scope.globals, scope.locals):
+        for key, value in variables.items():
+            string = string.replace(virtual_vars % key, value)
     return string
@@ -13,10 +13,10 @@ from __future__ import annotations
 
 import ast
 import asyncio
+import functools
 import inspect
 import linecache
 import os
-import pathlib
 import queue
 import subprocess
 import sys
@@ -30,6 +30,7 @@ from typing import (
     Dict,
     List,
     Optional,
+    Sequence,
     Tuple,
     TypeVar,
     Union,
@@ -43,6 +44,8 @@ from dev.pagination import Paginator
 from dev.utils.functs import interaction_response, send
 
 if TYPE_CHECKING:
+    from types import CodeType
+
     from discord.ext import commands
     from typing_extensions import ParamSpec
 
@@ -72,10 +75,42 @@ async def _executor({0}):
     """
 
 WINDOWS = sys.platform == "win32"
-POWERSHELL = pathlib.Path(r"C:\Windows\System32\WindowsPowerShell\v1.0\powershell.exe").exists() if WINDOWS else False
+POWERSHELL = os.path.exists(r"C:\Windows\System32\WindowsPowerShell\v1.0\powershell.exe") if WINDOWS else False
 SHELL = os.getenv("SHELL") or "/bin/bash"
 
 
+def _wrap_code(code: str, args_name: Sequence[str], /) -> ast.Module:
+    tree = ast.parse(code)
+    template: ast.Module = ast.parse(CODE_TEMPLATE.format(", ".join(args_name)))
+    function: ast.AsyncFunctionDef = template.body[-1]  # type: ignore
+
+    ast_try: ast.Try = function.body[-1]  # type: ignore
+    #  Both trees come straight from ast.parse(), and the yields below copy the location
+    #  of the expression they replace, so there are never any locations left to fill in.
+    ast_try.body.extend(tree.body)
+    expressions: List[ast.stmt] = ast_try.body
+
+    for index, expr in enumerate(reversed(expressions), start=1):
+        if not isinstance(expr, ast.Expr):
+            return template
+
+        if not isinstance(expr.value, ast.Yield):
+            yield_stmt = ast.Yield(expr.value)
+            ast.copy_location(yield_stmt, expr)
+            yield_expr = ast.Expr(yield_stmt)
+            ast.copy_location(yield_expr, expr)
+            ast_try.body[-index] = yield_expr
+    return template
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_wrapper(code: str, args_name: Tuple[str, ...], /) -> CodeType:
+    #  Code objects are immutable and don't hold on to the namespace they get executed in,
+    #  so running the same snippet again (or overriding a command with the same script)
+    #  can skip parsing, wrapping and compiling it.
+    return compile(_wrap_code(code, args_name), "<repl>", "exec")
+
+
 class _InputModal(discord.ui.Modal):
     input_message: discord.ui.TextInput[_InputModal] = discord.ui.TextInput(label="Standard input")
 
@@ -432,7 +467,7 @@ class Process:
         cwd = ""
         for maybe_path in reversed(maybe_cwd.split()):
             cwd = (maybe_path + " " + cwd).strip()
-            if pathlib.Path(cwd).exists():
+            if os.path.exists(cwd):
                 return cwd
         return None
 
@@ -551,7 +586,7 @@ class ShellSession:
         self._previous_processes.append(line)
         if self.paginator is not None:
             return line.replace("`", "`\u200b")
-        return (f"```{self.highlight}\n" + "\n".join(self._previous_processes) + "\n").strip("\n") + "```"
+        return self._render("\n").strip("\n") + "```"
 
     def set_exit_message(self, msg: str, /) -> str:
         """This is a shorthand to :meth:`add_line` followed by setting :attr:`terminated` to
@@ -570,7 +605,7 @@ class ShellSession:
         self.terminated = True
         if self.paginator is not None:
             return msg.replace("`", "`\u200b")
-        return f"```{self.highlight}\n" + "\n".join(self._previous_processes) + f"```\n{msg}"
+        return self._render(f"```\n{msg}")
 
     @property
     def raw(self) -> str:
@@ -579,7 +614,11 @@ class ShellSession:
         """
         if self.paginator is not None:
             return ""
-        return f"```{self.highlight}\n" + "\n".join(self._previous_processes) + "```"
+        return self._render("```")
+
+    def _render(self, end: str, /) -> str:
+        #  Joining the pieces at once avoids copying the whole history again for every concatenation
+        return "".join((f"```{self.highlight}\n", "\n".join(self._previous_processes), end))
 
     @property
     def suffix(self) -> str:
@@ -667,7 +706,13 @@ class Execute:
     def function(self) -> Callable[..., Union[AsyncGenerator[Any, Any], Coro[Any]]]:
         if self._executor is not None:
             return self._executor
-        exec(compile(self.wrapper(), "<repl>", "exec"), self.vars.globals, self.vars.locals)
+        if type(self).wrapper is Execute.wrapper:
+            #  The default wrapper only depends on the code and argument names, so its compiled
+            #  form can be shared. Subclasses that customize the wrapper get theirs compiled as is.
+            code = _compile_wrapper(self.code, tuple(self.args_name))
+        else:
+            code = compile(self.wrapper(), "<repl>", "exec")
+        exec(code, self.vars.globals, self.vars.locals)
         self._executor = self.vars["_executor"]
         return self._executor
 
@@ -695,24 +740,4 @@ class Execute:
             raise
 
     def wrapper(self) -> ast.Module:
-        code = ast.parse(self.code)
-        template: ast.Module = ast.parse(CODE_TEMPLATE.format(", ".join(self.args_name), int(time.time())))
-        function: ast.AsyncFunctionDef = template.body[-1]  # type: ignore
-
-        ast_try: ast.Try = function.body[-1]  # type: ignore
-        ast_try.body.extend(code.body)
-        ast.fix_missing_locations(template)
-        ast.NodeTransformer().generic_visit(ast_try)
-        expressions: List[ast.stmt] = ast_try.body
-
-        for index, expr in enumerate(reversed(expressions), start=1):
-            if not isinstance(expr, ast.Expr):
-                return template
-
-            if not isinstance(expr.value, ast.Yield):
-                yield_stmt = ast.Yield(expr.value)
-                ast.copy_location(yield_stmt, expr)
-                yield_expr = ast.Expr(yield_stmt)
-                ast.copy_location(yield_expr, expr)
-                ast_try.body[-index] = yield_expr
-        return template
+        return _wrap_code(self.code, self.args_name)
@@ -110,13 +110,15 @@ class Interface(discord.ui.View):
 
     def reset(self) -> None:
         """Resets the entire interface, setting the current page to the last one."""
-        if len(self.paginator.pages) <= 1:
+        #  Paginator.pages renders a new list every time it is accessed
+        total = len(self.paginator.pages)
+        if total <= 1:
             self.first_page.disabled = True
             self.previous_page.disabled = True
         self.last_page.disabled = True
         self.next_page.disabled = True
 
-        self._display_page_count: int = len(self.paginator.pages)
+        self._display_page_count: int = total
         self._page_count: int = self._display_page_count - 1
         self.current.label = f"{self._display_page_count}/{self._display_page_count}"
 
@@ -134,7 +136,8 @@ class Interface(discord.ui.View):
     def page_num(self, item: int) -> None:
         self._display_page_count = item
         self._page_count = item - 1
-        if item == len(self.paginator.pages):
+        total = len(self.paginator.pages)
+        if item == total:
             self.last_page.disabled = True
             self.next_page.disabled = True
         if item == 1:
@@ -143,10 +146,10 @@ class Interface(discord.ui.View):
         else:
             self.first_page.disabled = False
             self.previous_page.disabled = False
-        if item < len(self.paginator.pages):
+        if item < total:
             self.last_page.disabled = False
             self.next_page.disabled = False
-        self.current.label = f"{item}/{len(self.paginator.pages)}"
+        self.current.label = f"{item}/{total}"
 
     @discord.ui.button(label="\N{MUCH LESS-THAN}")
     async def first_page(self, interaction: discord.Interaction, _) -> None:
@@ -56,7 +56,7 @@ class RootEnvironment(root.Plugin):
         elif mode in ["delete", "remove"]:
             if name is None:
                 raise commands.MissingRequiredArgument(ctx.command.clean_params["name"])  # type: ignore
-            if self.scope.get(name, False):
+            if name in self.scope:
                 del self.scope[name]
                 return await send(ctx, f"Successfully deleted the variable `{name}`.")
             await send(ctx, f"No variable called `{name}` found.")
@@ -73,7 +73,7 @@ class RootEnvironment(root.Plugin):
                 ),
             )
 
-        elif mode in ["all"]:
+        elif mode == "all":
             variables = self.scope.keys()
             if not variables:
                 return await send(ctx, "No variables have been created yet.")
@@ -11,10 +11,14 @@ Files and folders manager.
 """
 from __future__ import annotations
 
+import contextlib
+import errno
+import functools
 import os
 import pathlib
 import shutil
-from typing import TYPE_CHECKING, List, Optional
+import stat
+from typing import TYPE_CHECKING, BinaryIO, List, Optional
 
 import discord
 from discord.ext import commands
@@ -22,18 +26,103 @@ from discord.ext import commands
 from dev import root
 from dev.components import Prompt
 from dev.scope import Settings
+from dev.types import Annotated
 from dev.utils.functs import send
-from dev.utils.utils import escape
+from dev.utils.utils import escape, in_executor
 
 if TYPE_CHECKING:
     from dev import types
 
+_BRANCH = "\N{BOX DRAWINGS DOUBLE VERTICAL AND RIGHT}\N{BOX DRAWINGS DOUBLE HORIZONTAL} "
+_LAST_BRANCH = "\N{BOX DRAWINGS DOUBLE UP AND RIGHT}\N{BOX DRAWINGS DOUBLE HORIZONTAL} "
+_FOLDER = "\N{FILE FOLDER} "
+_FILE = "\N{PAGE FACING UP} "
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_path(path: str, /) -> pathlib.Path:
+    #  normpath collapses duplicate separators and '..' segments that pathlib would otherwise keep.
+    return pathlib.Path(os.path.normpath(path))
+
+
+def _format_path(argument: str, /) -> pathlib.Path:
+    #  Relative paths are anchored on Settings.CWD, which is also what
+    #  the explorer defaults to when no path is given. Absolute ones
+    #  don't need the setting at all.
+    if not os.path.isabs(argument):
+        argument = os.path.join(Settings.CWD, argument)
+    return _resolve_path(argument)
+
+
+def _render_tree(path: pathlib.Path, /) -> Optional[str]:
+    #  Large directories make for a lot of string building, so the whole
+    #  listing is rendered here and run in the default executor.
+    folders: List[str] = []
+    files: List[str] = []
+    #  DirEntry reuses the file type reported while reading the directory,
+    #  so unlike Path.iterdir() this doesn't stat every single entry.
+    with os.scandir(path) as entries:
+        for entry in entries:
+            #  Entries are displayed relative to the listed directory
+            if entry.is_dir():
+                folders.append(_FOLDER + escape(os.sep + entry.name))
+            elif entry.is_file():
+                files.append(_FILE + escape(os.sep + entry.name))
+    if not folders and not files:
+        return None
+    folders.extend(files)
+    #  Branches are only added while joining, so the last row can
+    #  get its own prefix without rebuilding the string.
+    last = folders.pop()
+    rows = "".join(f"\n{_BRANCH}{row}" for row in folders)
+    return f"\N{OPEN FILE FOLDER} {escape(str(path))}{rows}\n{_LAST_BRANCH}{last}"
+
+
+def _open_file(path: pathlib.Path, /) -> Optional[discord.File]:
+    #  discord.File opens the file right away, so it is created here alongside the check
+    #  that makes sure that it is a regular file (which excludes e.g. FIFOs).
+    if not path.is_file():
+        return None
+    return discord.File(path)
+
+
+async def _stat_mode(path: pathlib.Path, /) -> Optional[int]:
+    #  A missing parent and a parent that is actually a file both
+    #  mean that there is nothing at the given path.
+    try:
+        return (await in_executor(os.stat, path)).st_mode
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _discard(fp: BinaryIO, path: pathlib.Path, /) -> None:
+    #  Cleaning up after a failed upload must never hide the error that caused it
+    with contextlib.suppress(OSError):
+        fp.close()
+    with contextlib.suppress(OSError):
+        path.unlink()
+
+
+async def _save_attachment(attachment: discord.Attachment, path: pathlib.Path, /) -> None:
+    #  Opening in 'x' mode refuses to replace existing files, without having to check beforehand.
+    #  Attachment.save() downloads through the bot's own HTTP session, so its proxy settings apply.
+    fp = await in_executor(lambda: path.open("xb"))
+    try:
+        await attachment.save(fp, seek_begin=False)
+    except BaseException:
+        #  This may be a cancellation, so don't await anything before re-raising
+        _discard(fp, path)
+        raise
+    await in_executor(fp.close)
+
 
 class RootFiles(root.Plugin):
     """File, folder, and directory management"""
 
     @root.group("explorer", parent="dev", aliases=["explr", "explorer!", "explr!"], invoke_without_command=True)
-    async def root_explorer(self, ctx: commands.Context[types.Bot], *, path: Optional[pathlib.Path] = None):
+    async def root_explorer(
+        self, ctx: commands.Context[types.Bot], *, path: Optional[Annotated[pathlib.Path, _format_path]] = None
+    ):
         """View the tree of a directory or send a file.
 
         Parameters
@@ -44,32 +133,25 @@ class RootFiles(root.Plugin):
         assert ctx.invoked_with is not None
         if path is None:
             path = pathlib.Path(Settings.CWD)
-        if not path.exists():
+        #  Scanning right away saves statting the path beforehand;
+        #  only files need the extra check (which excludes e.g. FIFOs).
+        try:
+            tree = await in_executor(_render_tree, path)
+        except FileNotFoundError:
             return await send(ctx, "File or directory not found.")
-        if path.is_file():
-            return await send(ctx, discord.File(path))
-        folders: List[str] = []
-        files: List[str] = []
-        for item in path.iterdir():
-            if item.is_dir():
-                folders.append("\N{FILE FOLDER} " + escape(str(item.absolute())))
-            elif item.is_file():
-                files.append("\N{PAGE FACING UP} " + escape(str(item.absolute())))
-        if not folders and not files:
+        except NotADirectoryError:
+            file = await in_executor(_open_file, path)
+            if file is None:
+                return await send(ctx, "File or directory not found.")
+            return await send(ctx, file)
+        if tree is None:
             return await send(ctx, "Directory is empty.")
-        *finalized, last = [
-            f"\N{BOX DRAWINGS DOUBLE VERTICAL AND RIGHT}\N{BOX DRAWINGS DOUBLE HORIZONTAL} {item.replace(str(path.absolute()), '', 1)}"
-            for item in (*folders, *files)
-        ]
-        last = f"\N{BOX DRAWINGS DOUBLE UP AND RIGHT}{last[1:]}"
-        await send(
-            ctx,
-            f"\N{OPEN FILE FOLDER} {escape(str(path.absolute()))}\n" + "\n".join(finalized) + f"\n{last}",
-            path_to_file=not ctx.invoked_with.endswith("!"),
-        )
+        await send(ctx, tree, path_to_file=not ctx.invoked_with.endswith("!"))
 
     @root.command("mkdir", parent="dev explorer", aliases=["touch"])
-    async def root_explorer_mkdir(self, ctx: commands.Context[types.Bot], *, path: Optional[pathlib.Path] = None):
+    async def root_explorer_mkdir(
+        self, ctx: commands.Context[types.Bot], *, path: Optional[Annotated[pathlib.Path, _format_path]] = None
+    ):
         """Create a new file or directory. Use touch or mkdir respectively.
 
         If attachments are provided, they will be uploaded to the given directory.
@@ -88,18 +170,17 @@ class RootFiles(root.Plugin):
             path = pathlib.Path(Settings.CWD)
             if not attachments:
                 # We know Current Working Directory already exists
-                raise commands.MissingRequiredArgument(ctx.command.params["name"])
-        if path.exists():
-            if path.is_dir() and attachments:
+                raise commands.MissingRequiredArgument(ctx.command.params["path"])
+        mode = await _stat_mode(path)
+        if mode is not None:
+            if stat.S_ISDIR(mode) and attachments:
                 skipped: List[pathlib.Path] = []
                 for attach in attachments:
-                    content = await attach.read()
                     as_path = path / attach.filename
-                    if as_path.exists():
+                    try:
+                        await _save_attachment(attach, as_path)
+                    except FileExistsError:
                         skipped.append(as_path)
-                        continue
-                    with as_path.open("wb") as fp:
-                        fp.write(content)
                 fmt = (
                     (
                         "\n\nSkipped the following attachments because duplicates were found:\n"
@@ -111,14 +192,18 @@ class RootFiles(root.Plugin):
                 return await send(ctx, f"Successfully finished uploading attachments to directory.{fmt}")
             return await send(ctx, "File or directory already exists.")
         if ctx.invoked_with == "mkdir":
-            path.mkdir()
+            await in_executor(path.mkdir)
             return await ctx.message.add_reaction("\N{BALLOT BOX WITH CHECK}")
-        path.touch()
+        await in_executor(path.touch)
         await ctx.message.add_reaction("\N{BALLOT BOX WITH CHECK}")
 
     @root.command("move", parent="dev explorer", aliases=["mv"], require_var_positional=True)
     async def root_explorer_move(
-        self, ctx: commands.Context[types.Bot], target: pathlib.Path, *, destination: pathlib.Path
+        self,
+        ctx: commands.Context[types.Bot],
+        target: Annotated[pathlib.Path, _format_path],
+        *,
+        destination: Annotated[pathlib.Path, _format_path],
     ):
         """Move an item from one directory to another.
 
@@ -129,23 +214,27 @@ class RootFiles(root.Plugin):
         destination: :class:`pathlib.Path`
             The directory where the given file or folder will be moved to.
         """
-        if destination.is_file():
-            return await send(ctx, "Target directory is a file.")
-        if not destination.exists():
+        mode = await _stat_mode(destination)
+        if mode is None:
             return await send(ctx, "Target directory does not exist.")
-        if not target.exists():
+        if not stat.S_ISDIR(mode):
+            return await send(ctx, "Target directory is a file.")
+        if await _stat_mode(target) is None:
             return await send(ctx, "Origin file or folder does not exist.")
 
         async def move():
             if duplicate is not None:
-                if duplicate.is_file():
-                    duplicate.unlink()
+                if await in_executor(duplicate.is_file):
+                    await in_executor(duplicate.unlink)
                 else:
-                    duplicate.rmdir()
-            shutil.move(str(target.absolute()), destination)
+                    await in_executor(duplicate.rmdir)
+            await in_executor(shutil.move, str(target), destination)
             await ctx.message.add_reaction("\N{BALLOT BOX WITH CHECK}")
 
-        duplicate = discord.utils.get(destination.iterdir(), name=target.name)
+        #  Look the name up directly instead of scanning the whole destination
+        duplicate: Optional[pathlib.Path] = destination / target.name
+        if not await in_executor(os.path.lexists, duplicate):
+            duplicate = None
         if duplicate is not None:
             return await send(
                 ctx,
@@ -156,7 +245,9 @@ class RootFiles(root.Plugin):
         await move()
 
     @root.command("rename", parent="dev explorer", require_var_positional=True)
-    async def root_explorer_rename(self, ctx: commands.Context[types.Bot], origin: pathlib.Path, *, name: str):
+    async def root_explorer_rename(
+        self, ctx: commands.Context[types.Bot], origin: Annotated[pathlib.Path, _format_path], *, name: str
+    ):
         """Rename a given item. The new name should be provided without any parent directories.
 
         Parameters
@@ -166,22 +257,27 @@ class RootFiles(root.Plugin):
         name: :class:`str`
             The new name that the item should receive.
         """
-        if pathlib.Path(name).exists():
+        try:
+            #  Swapping the last component keeps the item in its parent directory,
+            #  without splitting the path or statting the origin to find it.
+            target = origin.with_name(name)
+        except ValueError:
+            return await send(ctx, "Invalid new name provided.")
+        if await in_executor(os.path.lexists, target):
             return await send(ctx, "New path name already exists.")
-        if not origin.exists():
-            return await send(ctx, "File or directory not found.")
-        parent = origin.parent if origin.is_file() else origin
         try:
-            origin.rename(parent / name)
+            await in_executor(origin.rename, target)
         except FileNotFoundError:
-            # We already checked if the origin exists, so this means that something went wrong with name
-            return await send(ctx, "Invalid new name provided.")
+            #  The target shares the origin's parent, so it has to be the origin that is missing
+            return await send(ctx, "File or directory not found.")
         await ctx.message.add_reaction("\N{BALLOT BOX WITH CHECK}")
 
     @root.command(
         "delete", parent="dev explorer", aliases=["del", "remove", "rm", "rmdir"], require_var_positional=True
     )
-    async def root_explorer_delete(self, ctx: commands.Context[types.Bot], *, path: pathlib.Path):
+    async def root_explorer_delete(
+        self, ctx: commands.Context[types.Bot], *, path: Annotated[pathlib.Path, _format_path]
+    ):
         """Delete a file or directory. For security reasons, current working directory is blacklisted.
 
         If provided with a directory that is not empty, a prompt will show before deleting.
@@ -191,19 +287,27 @@ class RootFiles(root.Plugin):
         path: :class:`pathlib.Path`
             The file or directory that will be removed.
         """
-        if not path.exists():
+        mode = await _stat_mode(path)
+        if mode is None:
             return await send(ctx, "File or directory not found.")
-        if str(path.absolute()) == os.getcwd():
-            return await send(ctx, "For security reasons, deleting current working directory is not allowed.")
-        if path.is_file():
-            path.unlink()
+        if not stat.S_ISDIR(mode):
+            await in_executor(path.unlink)
             return await ctx.message.add_reaction("\N{BALLOT BOX WITH CHECK}")
+        #  Formatted paths are already absolute and normalized, and only
+        #  a directory can be the working directory in the first place.
+        if str(path) == os.getcwd():
+            return await send(ctx, "For security reasons, deleting current working directory is not allowed.")
         try:
-            path.rmdir()
-        except OSError:
+            await in_executor(path.rmdir)
+        except OSError as exc:
+            #  rmdir doubles as the emptiness check, but only these errors mean that
+            #  the directory has children. Anything else (e.g. permissions) would
+            #  just fail again when confirming the prompt.
+            if exc.errno not in (errno.ENOTEMPTY, errno.EEXIST):
+                return await send(ctx, f"Could not delete directory. {exc.strerror}.")
 
             async def func() -> None:
-                shutil.rmtree(path)
+                await in_executor(shutil.rmtree, path)
                 await ctx.message.add_reaction("\N{BALLOT BOX WITH CHECK}")
 
             return await send(
@@ -48,6 +48,14 @@ CONTENT_TYPES: Dict[str, str] = {
     "video/mp4": "mp4",
     "video/webm": "webm",
 }
+#  Embed colors for each class of HTTP status codes, keyed by their first digit.
+_STATUS_COLORS: Dict[str, discord.Color] = {
+    "1": discord.Color.light_grey(),
+    "2": discord.Color.green(),
+    "3": discord.Color.gold(),
+    "4": discord.Color.red(),
+    "5": discord.Color.dark_red(),
+}
 
 
 class RootHTTP(root.Plugin):
@@ -97,19 +105,12 @@ class RootHTTP(root.Plugin):
             if mode == "status":
                 status = str(request.status)
                 status_type = responses[status[0]]
-                colors = {
-                    "1": discord.Color.light_grey(),
-                    "2": discord.Color.green(),
-                    "3": discord.Color.gold(),
-                    "4": discord.Color.red(),
-                    "5": discord.Color.dark_red(),
-                }
                 await send(
                     ctx,
                     discord.Embed(
                         title=f"Status {status}",
                         description=f"{status_type} ‒ {request.reason}".strip(),  # type: ignore
-                        color=colors[status[0]],
+                        color=_STATUS_COLORS[status[0]],
                         url=f"https://developer.mozilla.org/en-US/docs/Web/HTTP/Status/{status}",
                     ),
                 )
@@ -20,11 +20,13 @@ from discord.ext import commands
 
 from dev import root
 from dev.utils.functs import send
-from dev.utils.utils import codeblock_wrapper, escape
+from dev.utils.utils import codeblock_wrapper, escape, get_source_lines
 
 if TYPE_CHECKING:
     from dev import types
 
+_PARAMETER_PREFIXES = {inspect.Parameter.KEYWORD_ONLY: r"\*, `", inspect.Parameter.VAR_POSITIONAL: r"`\*"}
+
 
 class RootInformation(root.Plugin):
     """Inspection commands"""
@@ -45,20 +47,14 @@ class RootInformation(root.Plugin):
             return await send(ctx, f"Command `{command_string}` not found.")
         params: List[str] = []
         for name, param in command.clean_params.items():
-            fmt = ""
-            if param.kind is inspect.Parameter.KEYWORD_ONLY:
-                fmt += r"\*, `"
-            elif param.kind is inspect.Parameter.VAR_POSITIONAL:
-                fmt += r"`\*"
-            else:
-                fmt += "`"
-            fmt += f"{name}"
-            if param.required:
-                fmt += "*"
-            fmt += f"`: {escape(repr(param.converter))}"
+            #  Work out each piece first so that the parameter is formatted in one go
+            #  rather than growing a new string with every piece that gets added.
+            prefix = _PARAMETER_PREFIXES.get(param.kind, "`")
+            required = "*" if param.required else ""
+            default = ""
             if param.default is not inspect.Parameter.empty:
-                fmt += f" = {escape(str(getattr(param.default, '__name__', param.default)))}"
-            params.append(fmt)
+                default = f" = {escape(str(getattr(param.default, '__name__', param.default)))}"
+            params.append(f"{prefix}{name}{required}`: {escape(repr(param.converter))}{default}")
 
         embed = discord.Embed(
             title=command.qualified_name,
@@ -96,7 +92,7 @@ class RootInformation(root.Plugin):
             return await send(ctx, f"Command `{command_string}` not found.")
 
         try:
-            source = inspect.getsource(command.callback)
+            lines, _ = get_source_lines(command.callback)
         except OSError:
             return await send(ctx, f"Couldn't get source lines for command `{command_string}`.")
-        await send(ctx, codeblock_wrapper(textwrap.dedent(source), "py"))
+        await send(ctx, codeblock_wrapper(textwrap.dedent("".join(lines)), "py"))
@@ -22,7 +22,7 @@ from discord.ext import commands
 from dev import root
 from dev.components import AuthoredMixin, PermissionsSelector, SettingsToggler
 from dev.utils.functs import send
-from dev.utils.utils import codeblock_wrapper, escape, format_exception, plural
+from dev.utils.utils import clear_source_cache, codeblock_wrapper, escape, format_exception, plural
 
 if TYPE_CHECKING:
     from dev import types
@@ -98,6 +98,8 @@ class RootManagement(root.Plugin):
                 successful += 1
                 output.append(f"{emoji} {ext}")
         end = time.perf_counter()
+        #  Cached source lookups may now point at stale or unloaded callbacks
+        clear_source_cache()
 
         embed = discord.Embed(
             title=f"{invoked_with.title()}ed {plural(successful, 'Cog')}",
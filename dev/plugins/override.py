@@ -12,8 +12,15 @@ Override or overwrite bot commands.
 from __future__ import annotations
 
 import ast
-import inspect
-import textwrap
+import contextlib
+import functools
+import itertools
+import linecache
+import os
+import re
+import shutil
+import tempfile
+import tokenize
 from typing import TYPE_CHECKING, Any, List, Literal, Optional
 
 from discord.ext import commands
@@ -26,10 +33,74 @@ from dev.interpreters import Execute
 from dev.scope import Scope
 from dev.types import Annotated
 from dev.utils.functs import send
+from dev.utils.utils import get_source_file, get_source_lines, in_executor
 
 if TYPE_CHECKING:
     from dev import types
 
+#  Matches the start of every line that isn't whitespace-only, like textwrap.indent() does,
+#  without having to split the script into lines and join them back together.
+_INDENT_LINES = re.compile(r"^(?=[^\n]*\S)", re.MULTILINE)
+
+_INVALID_SCRIPT = "The body of the script should consist of a single asynchronous function callback."
+
+
+def _may_hold_callback(script: str, /) -> bool:
+    #  A script without these can't hold an async function, so don't bother parsing it.
+    #  This is only a heuristic, since the words may as well be part of a comment or
+    #  string. Validating the parsed tree is still what decides whether a script is valid.
+    return "async" in script and "def" in script
+
+
+@functools.lru_cache(maxsize=128)
+def _parse(script: str, /) -> ast.Module:
+    #  Scripts tend to be sent again while they're being worked on. The trees are
+    #  only ever inspected, never modified, so it is safe to hand out the same one.
+    return ast.parse(script)
+
+
+def _replace_source(path: str, start: int, end: int, new_lines: List[str], /) -> None:
+    #  getsourcelines() loads the whole file into linecache, so there is no need to read
+    #  it again. Make sure that the cached copy is still up to date, since the lookup
+    #  may have been cached as well.
+    linecache.checkcache(path)
+    file_lines = linecache.getlines(path)
+    #  linecache swallows read and decode errors, and splicing into nothing
+    #  would replace the whole module with just the new callback.
+    if not file_lines:
+        raise OSError(f"Could not read source file {path}")
+    #  The untouched lines are written straight out of the cache instead of splicing the
+    #  new script into a copy of it. Writing to a sibling file and replacing the original
+    #  with it means that the source is never left half-written if anything goes wrong.
+    target = os.path.realpath(path)
+    #  The cached lines were decoded the same way the interpreter reads the module,
+    #  so write them back in that same encoding rather than the locale's.
+    with open(target, "rb") as fp:
+        encoding, _ = tokenize.detect_encoding(fp.readline)
+    #  The temporary file is hidden and doesn't end in .py, so that reloaders and importers
+    #  watching the package never pick it up, even if it is left behind after a crash.
+    fd, temp = tempfile.mkstemp(prefix=f".{os.path.basename(target)}.", suffix=".tmp", dir=os.path.dirname(target))
+    try:
+        try:
+            fp = open(fd, "w", encoding=encoding)
+        except BaseException:
+            #  The descriptor only belongs to the file object once it has been created.
+            #  CPython may have closed it already while failing, hence the suppression.
+            with contextlib.suppress(OSError):
+                os.close(fd)
+            raise
+        with fp:
+            fp.writelines(itertools.islice(file_lines, start))
+            fp.writelines(new_lines)
+            fp.writelines(itertools.islice(file_lines, end, None))
+        shutil.copymode(target, temp)
+        os.replace(temp, target)
+    except BaseException:
+        #  Failing to clean up must not hide the error that got us here
+        with contextlib.suppress(OSError):
+            os.unlink(temp)
+        raise
+
 
 class RootOverride(root.Plugin):
     """Override and overwrite commands"""
@@ -70,14 +141,15 @@ class RootOverride(root.Plugin):
 
         exception_handler: ExceptionHandler[Literal[False]] = ExceptionHandler(ctx.message, on_error)
         async with exception_handler:
-            ast_parse = ast.parse(script)
-            async_callback = isinstance(ast_parse.body[-1], ast.AsyncFunctionDef)
-            imports_exprs = len([expr for expr in ast_parse.body if isinstance(expr, (ast.Import, ast.ImportFrom))])
-            if not async_callback or len(ast_parse.body) > imports_exprs + 1:
-                return await send(
-                    ctx, "The body of the script should consist of a single asynchronous function callback."
-                )
-            ast_func: ast.AsyncFunctionDef = ast_parse.body[-1]  # type: ignore
+            if not _may_hold_callback(script):
+                return await send(ctx, _INVALID_SCRIPT)
+            ast_parse = _parse(script)
+            *imports_exprs, ast_callback = ast_parse.body
+            async_callback = isinstance(ast_callback, ast.AsyncFunctionDef)
+            #  Anything before the callback has to be an import
+            if not async_callback or not all(isinstance(expr, (ast.Import, ast.ImportFrom)) for expr in imports_exprs):
+                return await send(ctx, _INVALID_SCRIPT)
+            ast_func: ast.AsyncFunctionDef = ast_callback  # type: ignore
             scope = Scope(original.callback.__globals__)
             if original.cog is None:
                 code = f"{script}\nreturn {ast_func.name}"
@@ -85,9 +157,10 @@ class RootOverride(root.Plugin):
                 # Getting cog commands to register properly is pretty tricky.
                 # discord.py uses inspect to get function parameters, which means that
                 # I have to attach the callback to a class somehow.
+                body = _INDENT_LINES.sub("    ", script)
                 code = (
                     "from discord.ext import commands\n"
-                    f"class _TempCogSimulator(commands.Cog):\n{textwrap.indent(script, '    ')}\n"
+                    f"class _TempCogSimulator(commands.Cog):\n{body}\n"
                     f"return _TempCogSimulator.{ast_func.name}"
                 )
             executor = Execute(code, scope, {"bot": self.bot} if original.cog is None else {})
@@ -154,46 +227,22 @@ class RootOverride(root.Plugin):
         origin: Optional[types.Command] = self.bot.get_command(command_string)
         if origin is None:
             return await send(ctx, f"Command `{command_string}` not found.")
-        directory = inspect.getsourcefile(origin.callback)
+        directory = get_source_file(origin.callback)
         if directory is None:
             return await send(ctx, "Could not find source.")
-        lines, line_no = inspect.getsourcelines(origin.callback)
-        line_no -= 1
         exception_handler: ExceptionHandler[Literal[False]] = ExceptionHandler(ctx.message)
         async with exception_handler:
-            parsed = ast.parse(script)
+            if not _may_hold_callback(script):
+                return await send(ctx, _INVALID_SCRIPT)
+            parsed = _parse(script)
             if len(parsed.body) != 1 or not isinstance(parsed.body[0], ast.AsyncFunctionDef):
-                return await send(
-                    ctx, "The body of the script should consist of a single asynchronous function callback."
-                )
-        script_lines = script.split("\n")
-        indentation = 0
-        for char in lines[0]:
-            if char == " ":
-                indentation += 1
-            else:
-                break
-        code_split: List[str] = [f"{' ' * indentation}{line}" for line in script_lines]
-        with open(directory) as fp:
-            file_lines = fp.readlines()
-        start, end = line_no, line_no + (len(lines) - 1)
-        # make sure that we have the correct amount of lines necessary to include the new script
-        if len(code_split) > len(lines):
-            with open(directory, "w") as fp:
-                file_lines[end] += "\n" * (len(code_split) - len(lines))
-                end += len(code_split) - len(lines)
-                fp.writelines(file_lines)
-            with open(directory) as fp:
-                # since we edited the file, we have to get our new set of lines
-                file_lines = fp.readlines()
-        count = 0
-        for line in range(start, end + 1):
-            try:
-                file_lines[line] = code_split[count] + "\n"
-                count += 1
-            except IndexError:
-                # deal with any extra lines, so we don't get a huge whitespace
-                file_lines[line] = ""
-        with open(directory, "w") as fp:
-            fp.writelines(file_lines)
-        await ctx.message.add_reaction("\N{BALLOT BOX WITH CHECK}")
+                return await send(ctx, _INVALID_SCRIPT)
+            #  Only look the source up once the script is known to be valid,
+            #  since it means reading and tokenizing the whole file.
+            #  Both that and rewriting it block, so they're done in the executor.
+            lines, line_no = await in_executor(get_source_lines, origin.callback)
+            line_no -= 1
+            indentation = " " * (len(lines[0]) - len(lines[0].lstrip(" ")))
+            #  The script is only split once, straight into the lines that end up in the file
+            code_split: List[str] = [f"{indentation}{line}\n" for line in script.split("\n")]
+            await in_executor(_replace_source, directory, line_no, line_no + len(lines), code_split)
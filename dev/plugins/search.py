@@ -12,7 +12,7 @@ Global search command.
 from __future__ import annotations
 
 import difflib
-from typing import TYPE_CHECKING, List, Tuple
+from typing import TYPE_CHECKING, Dict, List, Tuple
 
 import discord
 
@@ -49,7 +49,7 @@ class RootSearch(root.Plugin):
             channels = members = emojis = roles = []
         cmds = _match(query, [(cmd.qualified_name, f"`{cmd.qualified_name}`") for cmd in self.bot.walk_commands()])
         cogs = _match(query, [(cog, f"`{cog}`") for cog in self.bot.cogs])
-        if not any(_ for _ in [channels, members, cmds, emojis, cogs, roles]):
+        if not any((channels, members, cmds, emojis, cogs, roles)):
             return await send(ctx, "Couldn't find anything.")
         embed = discord.Embed(title=f"Query {query} returned...", color=discord.Color.blurple())
         embed.set_footer(text="Category: All")
@@ -61,7 +61,8 @@ class RootSearch(root.Plugin):
 
 
 def _match(query: str, array: List[Tuple[str, str]]) -> List[str]:
-    results: List[str] = []
-    for match in difflib.get_close_matches(query, [item[0] for item in array], 10, 0.5):
-        results.append([item[1] for item in array][[item[0] for item in array].index(str(match))])
-    return results
+    names: List[str] = [name for name, _ in array]
+    #  Build the lookup once instead of rebuilding both lists and searching them for every match.
+    #  It is built in reverse so that, like list.index(), the first item with a given name is used.
+    mapping: Dict[str, str] = dict(reversed(array))
+    return [mapping[match] for match in difflib.get_close_matches(query, names, 10, 0.5)]
@@ -16,7 +16,7 @@ import pathlib
 import re
 import shutil
 import tempfile
-from typing import TYPE_CHECKING, Dict, List
+from typing import TYPE_CHECKING, Dict, List, Set
 
 import discord
 from discord.ext import commands
@@ -166,7 +166,9 @@ class RootShell(root.Plugin):
             if script is None:
                 return await send(ctx, "Malformed arguments were given.")
 
-            enabled_options: List[str] = [opt for opt in PYRIGHT_BOOLEANS if opt in cmd_args.split()]
+            #  Split the arguments once, rather than again for every option that gets checked
+            given: Set[str] = set(cmd_args.split())
+            enabled_options: List[str] = [opt for opt in PYRIGHT_BOOLEANS if opt in given]
 
             for compiled in PYRIGHT_ARGS:
                 match = compiled.search(cmd_args)
@@ -177,9 +179,7 @@ class RootShell(root.Plugin):
                 path = pathlib.Path(directory)
                 main_tmp = path / "main.py"
                 pyproject = path / "pyproject.toml"
-                main_tmp.touch()
-                pyproject.touch()
-
+                #  Opening the files for writing creates them, so they don't have to be touched beforehand
                 with main_tmp.open("w") as fp:
                     fp.write(
                         "\n".join(
@@ -228,7 +228,8 @@ class RootShell(root.Plugin):
             if script is None:
                 return await send(ctx, "Malformed arguments were given.")
 
-            enabled_options: List[str] = [opt for opt in BLACK_BOOLEANS if opt in cmd_args.split()]
+            given: Set[str] = set(cmd_args.split())
+            enabled_options: List[str] = [opt for opt in BLACK_BOOLEANS if opt in given]
 
             for compiled in BLACK_ARGS:
                 match = compiled.search(cmd_args)
@@ -238,7 +239,6 @@ class RootShell(root.Plugin):
             with tempfile.TemporaryDirectory() as directory:
                 path = pathlib.Path(directory)
                 main_tmp = path / "main.py"
-                main_tmp.touch()
                 with main_tmp.open("w") as fp:
                     fp.write(script)
                 full = f"cd {directory} && black main.py"
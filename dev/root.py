@@ -20,6 +20,7 @@ from discord.utils import MISSING
 
 from dev.scope import Scope, Settings
 from dev.utils.baseclass import Command, DiscordCommand, DiscordGroup, Group
+from dev.utils.utils import clear_source_cache
 
 if TYPE_CHECKING:
     from typing_extensions import Concatenate, ParamSpec, Self
@@ -123,30 +124,33 @@ class Plugin(commands.Cog):
     def __init__(self, bot: types.Bot) -> None:
         self.bot: types.Bot = bot
         self.commands: Dict[str, types.Command] = {}
-        root_commands: List[Union[Command[Plugin], Group[Plugin]]] = list(self.__get_commands())
-        root_commands.sort(key=lambda c: c.level)
+        root_commands: List[Union[Command[Plugin], Group[Plugin]]] = self.__get_commands()
+        #  Commands from previously loaded plugins take precedence when looking up parents.
+        #  The mapping is built once and kept up to date, rather than merged again for every command.
+        command_mapping: Dict[str, types.Command] = {c.qualified_name: c for c in Plugin.__plugin_commands__}
         for command in root_commands:
-            command = command.to_instance(
-                self.bot, {**self.commands, **{c.qualified_name: c for c in Plugin.__plugin_commands__}}
-            )
+            command = command.to_instance(self.bot, command_mapping)
             command.cog = self
             self.commands[command.qualified_name] = command
+            command_mapping.setdefault(command.qualified_name, command)
 
         Plugin.__plugin_commands__.extend(self.commands.values())
         self.__cog_commands__ = list({*self.commands.values(), *self.__cog_commands__})
 
     async def _eject(self, bot: types.Bot, guild_ids: Optional[Iterable[int]]) -> None:  # type: ignore
         await super()._eject(bot, guild_ids)
+        clear_source_cache()
+        ejected = set(self.commands.values())
+        Plugin.__plugin_commands__[:] = [c for c in Plugin.__plugin_commands__ if c not in ejected]
+        #  Later registrations overwrite earlier ones, leaving the most recent command of each name
+        remaining: Dict[str, types.Command] = {c.qualified_name: c for c in Plugin.__plugin_commands__}
         for command in self.commands.values():
-            Plugin.__plugin_commands__.remove(command)
             if command.parent is not None:
                 command.parent.remove_command(command.name)
                 add_command = command.parent.add_command
             else:
                 add_command = bot.add_command
-            second_command = discord.utils.get(
-                reversed(Plugin.__plugin_commands__), qualified_name=command.qualified_name
-            )
+            second_command = remaining.get(command.qualified_name)
             if second_command is not None:
                 add_command(second_command)
 
@@ -159,7 +163,8 @@ class Plugin(commands.Cog):
                 if isinstance(val, (Command, Group)):
                     val.cog = self
                     cmds[val.qualified_name] = val
-        return list(cmds.values())
+        #  Sort straight off the dictionary view instead of copying it into a list first.
+        return sorted(cmds.values(), key=lambda c: c.level)
 
     async def cog_check(self, ctx: commands.Context[types.Bot]) -> bool:  # type: ignore
         """A check that is called every time a dev command is invoked.
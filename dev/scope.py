@@ -13,8 +13,7 @@ from __future__ import annotations
 
 import itertools
 import os
-import pathlib
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Callable, Dict, Generic, Optional, Set, Tuple, Type, TypeVar, Union, get_origin
 
 import discord
@@ -31,10 +30,9 @@ T = TypeVar("T")
 
 
 def _path_exists(path: str) -> str:
-    _dir = pathlib.Path(path)
-    if not _dir.exists() or not _dir.is_dir():
+    if not os.path.isdir(path):
         raise NotADirectoryError(path)
-    return str(_dir.absolute())  # ensures that the path does not end in a slash
+    return os.path.abspath(path)  # ensures that the path does not end in a slash
 
 
 class Scope:
@@ -54,6 +52,8 @@ class Scope:
     When getting items, the global scope is prioritized over the local scope.
     """
 
+    __slots__ = ("globals", "locals")
+
     def __init__(
         self, __globals: Optional[Dict[str, Any]] = None, __locals: Optional[Dict[str, Any]] = None, /
     ) -> None:
@@ -67,6 +67,10 @@ class Scope:
         """Whether both global and local dictionaries are not empty."""
         return bool(self.globals or self.locals)
 
+    def __contains__(self, item: Any) -> bool:
+        """Whether `y` is in the global scope, local scope, or both."""
+        return item in self.globals or item in self.locals
+
     def __delitem__(self, key: Any) -> None:
         """Deletes `y` from the global scope, local scope, or both."""
         glob_exc, loc_ext = False, False
@@ -173,16 +177,22 @@ class Option(Generic[T]):
     converter: Optional[Callable[[Any], T]]
     value: Optional[T]
     _type: Type[T]
+    environ: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        #  The environment gets checked every time the option is accessed,
+        #  so only build the name of its variable once.
+        self.environ = f"DEV_{self.name.upper()}"
 
     def fetch(self) -> T:
-        from_env = os.getenv(f"DEV_{self.name.upper()}", "").strip()
+        from_env = os.getenv(self.environ, "").strip()
 
         if from_env:
             if self._type is bool:
                 return str(from_env).lower() == "true"  # type: ignore
             return self.convert(from_env)
         if self.value is not None:
-            os.environ[f"DEV_{self.name.upper()}"] = str(self.value)
+            os.environ[self.environ] = str(self.value)
             return self.value
         return self._type()
 
@@ -219,17 +229,20 @@ class _SettingsMeta(type):
         return super().__new__(cls, name, base, attrs)
 
     def __getattr__(cls, __name: str) -> Any:
-        if hasattr(cls, "__options__") and __name in cls.__options__:
-            return cls.__options__[__name].fetch()
+        #  Every option is looked up through here, so find it with a single dictionary
+        #  lookup instead of checking for it and then indexing. getattr() goes through
+        #  the MRO, so options are still found when looking them up on a subclass.
+        option: Optional[Option[Any]] = getattr(cls, "__options__", {}).get(__name)
+        if option is not None:
+            return option.fetch()
 
         return super().__getattribute__(__name)
 
     def __setattr__(cls, __name: str, __value: Any) -> None:
-        if __name in cls.__options__:
-            option: Option[Any] = cls.__options__[__name]
-
+        option: Optional[Option[Any]] = cls.__options__.get(__name)
+        if option is not None:
             converted = option.convert(__value)
-            os.environ[f"DEV_{option.name.upper()}"] = str(converted)
+            os.environ[option.environ] = str(converted)
         else:
             super().__setattr__(__name, __value)
 
@@ -57,25 +57,17 @@ def flag_parser(string: str, delimiter: str) -> Dict[str, Any]:
     Dict[:class:`str`, Any]
         The parsed string dictionary.
     """
-    keys: List[str] = []
+    first, *segments = string.split(delimiter)
+    keys: List[str] = [first.strip()] if segments else []
     values: List[str] = []
-    temp_string = ""
-    searching_for_value = False
-    for char in string:
-        if char == delimiter:
-            if searching_for_value:
-                values.append(" ".join(temp_string.split()[:-1]))
-                keys.append(temp_string.split()[-1])
-                searching_for_value = False
-                temp_string = ""
-            else:
-                keys.append(temp_string)
-                searching_for_value = True
-                temp_string = ""
-            continue
-        temp_string += char
-    if temp_string:
-        values.append(temp_string)
+    for segment in segments[:-1]:
+        #  The last word belongs to the next key, everything before it is the value
+        *value, key = segment.split()
+        values.append(" ".join(value))
+        keys.append(key)
+    last = segments[-1] if segments else first
+    if last:
+        values.append(last)
     for idx, value in enumerate(values):
         values[idx] = json.loads(str(value).lower())
     return dict(zip(keys, values))
@@ -91,8 +83,7 @@ def generate_table(**label_rows: List[str]) -> str:
 
     longest = len(max(label_rows.values(), key=len))
 
-    for idx, row in enumerate(label_rows.values()):
-        label = tuple(label_rows)[idx]
+    for idx, (label, row) in enumerate(label_rows.items()):
         largest = max((*row, label), key=len)
         padding = len(largest)
         extra = max(longest - len(row), 0)
@@ -100,15 +91,10 @@ def generate_table(**label_rows: List[str]) -> str:
             table[label] = row + [""] * extra
         else:
             table[fmt(label, padding)] = [fmt(r, padding) for r in row] + [""] * extra
-    ordered: List[List[str]] = []
-    for idx in range(longest):
-        row_values: List[str] = []
-        for row_idx in range(len(table.values())):
-            row_values.append(tuple(table.values())[row_idx][idx])
-        ordered.append(row_values)
     splitter = "+".join("-" * (len(lab) + (1 if idx == 0 else 2)) for idx, lab in enumerate(table))
     rendered: List[str] = [" | ".join(table), splitter.replace("-", "=")]
-    rendered.extend(" | ".join(r) + "\n" + splitter for r in ordered)
+    #  Every column has been padded to the same length, so transposing them yields the rows
+    rendered.extend(" | ".join(r) + "\n" + splitter for r in zip(*table.values()))
     return "\n".join(rendered)
 
 
@@ -166,7 +152,8 @@ async def send(  # type: ignore
         `content` exceeded the 2000-character limit, and `view` did not permit pagination to work
         due to the amount of components it included.
     """
-    replace_path_to_file: bool = options.pop("path_to_file", True)
+    #  Looked up once here instead of for every string that gets scrubbed
+    root_folder: Optional[str] = Settings.ROOT_FOLDER if options.pop("path_to_file", True) else None
     forced: bool = options.pop("forced", False)
     forced_pagination: bool = options.pop("forced_pagination", True)
 
@@ -180,9 +167,9 @@ async def send(  # type: ignore
     iterable_items: List[str] = []
     for item in args:
         if isinstance(item, discord.File):
-            _try_add("files", _check_file(item, token, replace_path_to_file), kwargs)
+            _try_add("files", _check_file(item, token, root_folder), kwargs)
         elif isinstance(item, discord.Embed):
-            _try_add("embeds", _check_embed(item, token, replace_path_to_file), kwargs)
+            _try_add("embeds", _check_embed(item, token, root_folder), kwargs)
         elif isinstance(item, (discord.GuildSticker, discord.StickerItem)):
             _try_add("stickers", item, kwargs)
         elif isinstance(item, discord.ui.View):
@@ -190,15 +177,15 @@ async def send(  # type: ignore
         elif isinstance(item, Iterable) and not isinstance(item, str):
             for i in item:  # type: ignore
                 if isinstance(i, discord.File):
-                    _try_add("files", _check_file(i, token, replace_path_to_file), kwargs)
+                    _try_add("files", _check_file(i, token, root_folder), kwargs)
                 elif isinstance(i, discord.Embed):
-                    _try_add("embeds", _check_embed(i, token, replace_path_to_file), kwargs)
+                    _try_add("embeds", _check_embed(i, token, root_folder), kwargs)
                 elif isinstance(i, (discord.GuildSticker, discord.StickerItem)):
                     _try_add("stickers", i, kwargs)
                 else:
-                    iterable_items.append(_replace(repr(i), token, path=replace_path_to_file))  # type: ignore
+                    iterable_items.append(_replace(repr(i), token, path=root_folder))  # type: ignore
         else:
-            content = _replace(_revert_virtual_var_value(str(item)), token, path=replace_path_to_file)
+            content = _replace(_revert_virtual_var_value(str(item)), token, path=root_folder)
             if iterable_items:
                 content = "\n".join(iterable_items) + "\n" + content
                 iterable_items.clear()
@@ -350,7 +337,8 @@ async def interaction_response(  # type: ignore
     token = interaction.client.http.token
     assert token is not None
 
-    replace_path_to_file: bool = options.pop("path_to_file", True)
+    #  Looked up once here instead of for every string that gets scrubbed
+    root_folder: Optional[str] = Settings.ROOT_FOLDER if options.pop("path_to_file", True) else None
     forced_pagination: bool = options.pop("forced_paginator", True)
     paginators: List[Interface] = []
 
@@ -359,21 +347,21 @@ async def interaction_response(  # type: ignore
     iterable_items: List[str] = []
     for item in args:
         if isinstance(item, discord.File):
-            _try_add("files", _check_file(item, token, replace_path_to_file), kwargs)
+            _try_add("files", _check_file(item, token, root_folder), kwargs)
         elif isinstance(item, discord.Embed):
-            _try_add("embeds", _check_embed(item, token, replace_path_to_file), kwargs)
+            _try_add("embeds", _check_embed(item, token, root_folder), kwargs)
         elif isinstance(item, discord.ui.View):
             kwargs["view"] = item
         elif isinstance(item, Iterable) and not isinstance(item, str):
             for i in item:  # type: ignore
                 if isinstance(i, discord.File):
-                    _try_add("files", _check_file(i, token, replace_path_to_file), kwargs)
+                    _try_add("files", _check_file(i, token, root_folder), kwargs)
                 elif isinstance(i, discord.Embed):
-                    _try_add("embeds", _check_embed(i, token, replace_path_to_file), kwargs)
+                    _try_add("embeds", _check_embed(i, token, root_folder), kwargs)
                 else:
-                    iterable_items.append(_replace(repr(i), token, path=replace_path_to_file))  # type: ignore
+                    iterable_items.append(_replace(repr(i), token, path=root_folder))  # type: ignore
         else:
-            content = _replace(_revert_virtual_var_value(str(item)), token, path=replace_path_to_file)
+            content = _replace(_revert_virtual_var_value(str(item)), token, path=root_folder)
             lang, content = _get_highlight_lang(content)
             if lang is not None:
                 content = f"```{lang}\n" + content.replace("``", "`\u200b`") + "```"
@@ -480,34 +468,41 @@ def _try_add(key: str, value: T, dictionary: Dict[str, List[T]]) -> None:
         dictionary[key] = [value]
 
 
-def _check_file(file: discord.File, token: str, /, replace_path: bool) -> discord.File:
+def _check_file(file: discord.File, token: str, /, root_folder: Optional[str]) -> discord.File:
+    content: bytes = file.fp.read()
     try:
-        string = _revert_virtual_var_value(_replace(file.fp.read().decode("utf-8"), token, path=replace_path)).encode(
-            "utf-8"
-        )
+        string = content.decode("utf-8")
     except UnicodeDecodeError:
-        return file
-    return discord.File(io.BytesIO(string), file.filename, spoiler=file.spoiler, description=file.description)
+        #  Binary files are sent as-is. The original file pointer has
+        #  already been consumed, so reuse the raw bytes that were read.
+        pass
+    else:
+        scrubbed = _revert_virtual_var_value(_replace(string, token, path=root_folder))
+        #  Most files contain nothing to scrub, in which case the bytes that
+        #  were read are still valid and don't have to be encoded again.
+        if scrubbed != string:
+            content = scrubbed.encode("utf-8")
+    return discord.File(io.BytesIO(content), file.filename, spoiler=file.spoiler, description=file.description)
 
 
-def _check_embed(embed: discord.Embed, token: str, /, replace_path: bool) -> discord.Embed:
+def _check_embed(embed: discord.Embed, token: str, /, root_folder: Optional[str]) -> discord.Embed:
     if title := embed.title:
-        embed.title = _replace(title, token, path=replace_path)
+        embed.title = _replace(title, token, path=root_folder)
     if description := embed.description:
-        embed.description = _replace(description, token, path=replace_path)
+        embed.description = _replace(description, token, path=root_folder)
     if footer := embed.footer.text:
-        embed.footer.text = _replace(footer, token, path=replace_path)
+        embed.footer.text = _replace(footer, token, path=root_folder)
     for field in embed.fields:
         assert field.name is not None and field.value is not None
-        field.name = _replace(field.name, token, path=replace_path)
-        field.value = _replace(field.value, token, path=replace_path)
+        field.name = _replace(field.name, token, path=root_folder)
+        field.value = _replace(field.value, token, path=root_folder)
     return embed
 
 
-def _replace(string: str, token: str, /, *, path: bool) -> str:
+def _replace(string: str, token: str, /, *, path: Optional[str]) -> str:
     string = string.replace(token, "[token]")
-    if path:
-        string = string.replace(Settings.ROOT_FOLDER, "~")
+    if path is not None:
+        string = string.replace(path, "~")
     return string
 
 
@@ -516,16 +511,23 @@ def _check_length(content: str) -> Union[Paginator, str]:
         highlight_lang = ""
         string = content
         if content.startswith("```") and content.endswith("```"):
-            highlight_lang = content.split("\n")[0][3:]
-            string = "\n".join(content.split("\n")[1:])[:-3]
+            #  Only the first line holds the language, the rest gets split below anyway
+            first_line, _, string = content.partition("\n")
+            highlight_lang = first_line[3:]
+            string = string[:-3]
         paginator = Paginator(prefix=f"```{highlight_lang}")
-        for line in string.split("\n"):
-            paginator.add_line(line.replace("``", "`\u200b`"))
+        #  Backticks never span across lines, so they can all be escaped in one go
+        for line in string.replace("``", "`\u200b`").split("\n"):
+            paginator.add_line(line)
         return paginator
     return content
 
 
 def _revert_virtual_var_value(string: str) -> str:
-    for name, value in root.Plugin.scope.items():
-        string = string.replace(value, name)
+    scope = root.Plugin.scope
+    #  Scope.items() copies both dictionaries into a new tuple, which
+    #  isn't needed just to look through them once per message.
+    for variables in (scope.globals, scope.locals):
+        for name, value in variables.items():
+            string = string.replace(value, name)
     return string
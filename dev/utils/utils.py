@@ -11,15 +11,38 @@ Basic utilities used within the dev extension.
 """
 from __future__ import annotations
 
+import asyncio
+import inspect
+import os
 import traceback
-from typing import TYPE_CHECKING, Dict, Optional, Type, overload
+import weakref
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar, overload
 
 from discord.utils import escape_markdown, escape_mentions
 
 if TYPE_CHECKING:
     from types import TracebackType
 
-__all__ = ("clean_code", "codeblock_wrapper", "escape", "format_exception", "plural", "responses")
+__all__ = (
+    "clean_code",
+    "clear_source_cache",
+    "codeblock_wrapper",
+    "escape",
+    "format_exception",
+    "get_source_file",
+    "get_source_lines",
+    "in_executor",
+    "plural",
+    "responses",
+)
+
+T = TypeVar("T")
+#  Modification time of the file, the lines of the source, and the line number it starts on
+_CachedLines = Tuple[int, Tuple[str, ...], int]
+
+#  Keyed weakly, so that callbacks of unloaded extensions (and their modules) can still be garbage collected
+_source_files: weakref.WeakKeyDictionary[Callable[..., Any], str] = weakref.WeakKeyDictionary()
+_source_lines: weakref.WeakKeyDictionary[Callable[..., Any], _CachedLines] = weakref.WeakKeyDictionary()
 
 responses: Dict[str, str] = {
     "1": "Informational response",
@@ -76,8 +99,10 @@ def clean_code(content: str) -> str:
       The cleaned up string without any leading or trailing backticks.
     """
     if content.startswith("```") and content.endswith("```"):
-        content = "\n".join(content.split("\n")[1:])
-        return "\n".join(content.split("\n")[:-1]) if content.rsplit("\n", maxsplit=1)[-1] == "```" else content[:-3]
+        #  Only the first and last lines matter, so there's no need to split the whole codeblock
+        content = content.partition("\n")[2]
+        head, _, tail = content.rpartition("\n")
+        return head if tail == "```" else content[:-3]
     return content
 
 
@@ -104,7 +129,7 @@ def codeblock_wrapper(content: str, highlight_language: str = "", /) -> str:
         The parsed codeblock.
     """
     if content.startswith("```") and content.endswith("```"):
-        new_content = "\n".join(content.split("\n")[1:])
+        new_content = content.partition("\n")[2]
         return f"```{highlight_language}\n{new_content}"
     return f"```{highlight_language}\n{content}\n```"
 
@@ -126,6 +151,27 @@ def escape(content: str) -> str:
     return escape_markdown(escape_mentions(content))
 
 
+async def in_executor(func: Callable[..., T], /, *args: Any) -> T:
+    """Run a blocking function in the event loop's default executor.
+
+    Filesystem calls can block for a while on slow or large trees,
+    so they should be kept away from the event loop.
+
+    Parameters
+    ----------
+    func: Callable[..., Any]
+        The blocking function that should be called.
+    args: Any
+        The positional arguments that should be passed to the function.
+
+    Returns
+    -------
+    Any
+        Whatever the function returned.
+    """
+    return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+
 def plural(amount: int, singular: str, include_amount: bool = True) -> str:
     """A helper function that returns a plural form of the word given if the amount isn't 1.
 
@@ -151,3 +197,84 @@ def plural(amount: int, singular: str, include_amount: bool = True) -> str:
         if amount == 1
         else f"{amount if include_amount else ''} {_plural}".strip()
     )
+
+
+def clear_source_cache() -> None:
+    """Forget every source lookup made by :func:`get_source_file` and :func:`get_source_lines`.
+
+    This should be called whenever extensions are loaded, reloaded or unloaded.
+    """
+    _source_files.clear()
+    _source_lines.clear()
+
+
+def get_source_file(callback: Callable[..., Any], /) -> Optional[str]:
+    """A cached version of :meth:`inspect.getsourcefile`.
+
+    Paths are looked up again if the file is no longer there, e.g. because it was moved or renamed.
+    Callbacks whose source file could not be found are never cached.
+
+    Parameters
+    ----------
+    callback: Callable[..., Any]
+        The function whose source file should be found.
+
+    Returns
+    -------
+    Optional[str]
+        The path to the file that the function was defined in, if any.
+    """
+    path = _source_files.get(callback)
+    if path is None or not os.path.exists(path):
+        path = inspect.getsourcefile(callback)
+        if path is None:
+            _source_files.pop(callback, None)
+            return None
+        _remember(_source_files, callback, path)
+    return path
+
+
+def get_source_lines(callback: Callable[..., Any], /) -> Tuple[List[str], int]:
+    """A cached version of :meth:`inspect.getsourcelines`.
+
+    Results are kept for as long as the modification time of the source file stays the same,
+    so functions that were edited on disk get looked up again.
+    This reads from the filesystem, so it may block.
+
+    Parameters
+    ----------
+    callback: Callable[..., Any]
+        The function whose source lines should be retrieved.
+
+    Returns
+    -------
+    Tuple[List[str], int]
+        A new list of the lines of the function's source and the line number it starts on.
+
+    Raises
+    ------
+    OSError
+        The source code could not be retrieved.
+    """
+    path = get_source_file(callback)
+    #  Some loaders report files that don't exist on disk. inspect may still find their
+    #  source through linecache, but without a modification time the result can't be cached.
+    try:
+        mtime = os.stat(path).st_mtime_ns if path is not None else None
+    except OSError:
+        mtime = None
+    cached = _source_lines.get(callback)
+    if mtime is not None and cached is not None and cached[0] == mtime:
+        return list(cached[1]), cached[2]
+    lines, line_no = inspect.getsourcelines(callback)
+    if mtime is not None:
+        _remember(_source_lines, callback, (mtime, tuple(lines), line_no))
+    return lines, line_no
+
+
+def _remember(cache: weakref.WeakKeyDictionary[Callable[..., Any], T], callback: Callable[..., Any], value: T) -> None:
+    #  Not every callable can be referenced weakly; those just don't get cached
+    try:
+        cache[callback] = value
+    except TypeError:
+        pass